@@ -1,14 +1,23 @@
 import asyncio
+import hashlib
+import io
+import json
+import queue
 import random
-import tempfile
 import os
+import re
+import sys
+import threading
 import speech_recognition as sr
 import edge_tts
-from playsound import playsound
+import miniaudio
+import numpy as np
+from faster_whisper import WhisperModel
 from langchain_groq import ChatGroq
-from langchain.memory import ConversationBufferMemory
-from langchain.schema import HumanMessage, SystemMessage
+from langchain.memory import ConversationSummaryBufferMemory
+from langchain.schema import AIMessage, HumanMessage, SystemMessage
 import logging
+from collections import OrderedDict
 import time
 import pygame
 from dotenv import load_dotenv
@@ -19,16 +28,137 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 MODEL_NAME = os.getenv("MODEL_NAME")
 TTS_VOICE = os.getenv("TTS_VOICE")
 MAX_TOKENS = 150
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "tiny.en")
+WHISPER_SAMPLE_RATE = 16000
+
+# Mic calibration is reused across launches until it is a day old
+CALIBRATION_FILE = os.path.join(os.path.expanduser("~"), ".maya", "calib.json")
+CALIBRATION_MAX_AGE = 24 * 60 * 60
+MIN_ENERGY_THRESHOLD = 300
+
+# Older turns are folded into a running summary; only the last few go in verbatim.
+# Memory is pruned to the same window, so every message is in one or the other.
+SUMMARY_TOKEN_LIMIT = 400
+RECENT_TURNS = 4
+
+# edge-tts sends 24 kHz mono MP3, so decode straight to that format
+TTS_SAMPLE_RATE = 24000
+TTS_PREBUFFER_BYTES = 4 * 1024   # ~0.7 s of audio before the device starts
+PLAYBACK_BUFFER_MS = 200
+TTS_CACHE_SIZE = 128
+
+# RMS of int16 playback samples at which the mouth half / fully opens
+MOUTH_HALF_RMS = 600
+MOUTH_OPEN_RMS = 2500
+UI_FPS = 30
+LEVEL_WINDOW_FRAMES = TTS_SAMPLE_RATE // UI_FPS  # one mouth level per ~33 ms of audio
+
+# LLM output is handed to TTS one sentence at a time
+MAX_SENTENCE_TOKENS = 80
+_SENTENCE_END_RE = re.compile(r"[.?!][\"')]*$")
+_ABBREVIATIONS = {"e.g.", "i.e.", "dr.", "mr.", "mrs.", "ms.", "vs."}
+
+# Whole-word matchers, so "maybe" isn't a goodbye and "badminton" isn't sad
+_GOODBYE_RE = re.compile(r"\b(?:bye|goodbye|quit|exit|stop|end)\b", re.I)
+_SAD_RE = re.compile(r"\b(?:sad|upset|bad|terrible)\b", re.I)
+_HAPPY_RE = re.compile(r"\b(?:happy|good|great|excited)\b", re.I)
+_TIRED_RE = re.compile(r"\b(?:tired|exhausted|sleepy)\b", re.I)
 
 # Logging setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Maya")
 
 
+# ============ AUDIO STREAMING ============
+class _ChunkSource(miniaudio.StreamableSource):
+    """MP3 bytes handed from the event loop to the decoder worker thread"""
+
+    def __init__(self):
+        self._chunks = queue.Queue()
+        self._pending = b""
+        self._eof = False
+
+    def feed(self, data: bytes):
+        self._chunks.put(data)
+
+    def finish(self):
+        self._chunks.put(None)
+
+    def read(self, num_bytes: int) -> bytes:
+        # Blocks the decoder until more audio arrives; b"" tells it we're done
+        while not self._pending and not self._eof:
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._eof = True
+            else:
+                self._pending = chunk
+        data, self._pending = self._pending[:num_bytes], self._pending[num_bytes:]
+        return data
+
+
+def _is_sentence_boundary(text: str, next_token: str, token_count: int) -> bool:
+    """Decide whether buffered LLM text is ready to be spoken, given the token after it"""
+    if token_count >= MAX_SENTENCE_TOKENS:
+        return True
+    # Punctuation only ends a sentence when whitespace follows: "3." + "14" is a number
+    if not (text[-1:].isspace() or next_token[:1].isspace()):
+        return False
+    stripped = text.rstrip()
+    if _SENTENCE_END_RE.search(stripped):
+        return stripped.split()[-1].lower() not in _ABBREVIATIONS
+    return stripped.endswith(",") and len(stripped.split()) >= 4
+
+
+def _trim_history(messages: list) -> list:
+    """Keep only non-empty user/assistant text from the last few turns. A reply at the
+    front whose question was pruned is kept: the question is in the summary."""
+    history = []
+    for m in reversed(messages):  # walk back from the newest, no copy of the full list
+        if len(history) == 2 * RECENT_TURNS:
+            break
+        if isinstance(m, (HumanMessage, AIMessage)) and m.content.strip():
+            history.append(m)
+    history.reverse()
+    return history
+
+
 # ============ MAYA AI COMPANION ============
 class MayaAI:
-    def __init__(self):
-        self.conversation_history = []
+    # Fixed lines, pre-synthesized so they play without a TTS round-trip
+    GREETING = "Hey! I'm Maya. How are you feeling today?"
+    GOODBYE = ("It was lovely chatting with you. "
+               "I won’t remember this next time, "
+               "but I enjoyed talking to you now.")
+    SEE_YOU_LATER = "Alright, I'll see you later!"
+    SESSION_OVER = "Our session is ending now. See you next time!"
+    INACTIVE = "I didn’t hear you for a while, so I’ll end our chat. Bye!"
+    ERROR = "Oops, something went wrong. Let's try again."
+
+    # Replies used when the AI client is unavailable or fails
+    FALLBACK_RESPONSES = {
+        "sad": [
+            "I'm sorry you're feeling that way. I'm here to listen.",
+            "That sounds rough. Do you want to talk about it?",
+            "I hear you. You’re not alone in this."
+        ],
+        "happy": [
+            "That's wonderful! Tell me more!",
+            "I’m so glad to hear that. What made you feel this way?",
+            "Your happiness makes me happy too!"
+        ],
+        "tired": [
+            "You sound tired. Make sure you rest well.",
+            "Sleep is important. Have you been overworking?",
+            "Take care of yourself, okay?"
+        ],
+        "neutral": [
+            "That's interesting. Tell me more!",
+            "I'm listening closely. What else is on your mind?",
+            "Thanks for sharing. How does that make you feel?"
+        ],
+    }
+
+    def __init__(self, recalibrate: bool = False):
         self.recognizer = sr.Recognizer()
         self.microphone = sr.Microphone()
 
@@ -36,16 +166,15 @@ class MayaAI:
         pygame.init()
         self.screen = pygame.display.set_mode((500, 700))
         pygame.display.set_caption("Maya Video Call")
-        self.clock = pygame.time.Clock()
+        self._ui_task = None
+        self._quit = asyncio.Event()             # window closed by the user
+        self._stop_listening = threading.Event()  # same signal, for the mic thread
+        self._shutdown = asyncio.Event()         # conversation over, stop the UI loop
 
-        # Load & scale images once
-        self.mouth_half = pygame.image.load("assets/mouth_half_opened.png")
-        self.mouth_closed = pygame.image.load("assets/mouth_closed.png")
-        self.mouth_open = pygame.image.load("assets/mouth_full_opened.png")
-
-        self.mouth_half = pygame.transform.smoothscale(self.mouth_half, self.screen.get_size())
-        self.mouth_closed = pygame.transform.smoothscale(self.mouth_closed, self.screen.get_size())
-        self.mouth_open = pygame.transform.smoothscale(self.mouth_open, self.screen.get_size())
+        # Load, scale & convert images once (display pixel format, so blits need no conversion)
+        self.mouth_half = self._load_face("assets/mouth_half_opened.png")
+        self.mouth_closed = self._load_face("assets/mouth_closed.png")
+        self.mouth_open = self._load_face("assets/mouth_full_opened.png")
 
         self.current_face = self.mouth_closed
 
@@ -66,11 +195,40 @@ class MayaAI:
             logger.error(f"AI client setup failed: {e}")
             self.ai_client = None
 
-        # Conversation memory
-        self.memory = ConversationBufferMemory(return_messages=True)
+        # ---------- Local speech-to-text ----------
+        # Loaded once; int8 on CPU keeps transcription well under the speech length
+        try:
+            self.stt_model = WhisperModel(WHISPER_MODEL, device="cpu", compute_type="int8")
+            logger.info(f"Whisper model '{WHISPER_MODEL}' loaded.")
+        except Exception as e:
+            logger.error(f"Whisper model load failed: {e}. Using Google speech recognition.")
+            self.stt_model = None
+
+        # Synthesized MP3 per (text, voice), least recently used first
+        self._tts_cache = OrderedDict()
+        self._prewarm_task = None
+        self._listening = asyncio.Event()  # set while the mic is capturing, i.e. TTS is idle
+
+        # One TTS stream and one transcription at a time. On a single-user CPU
+        # client a second concurrent decode/request only splits the same cores
+        # (Semaphore(2) thrashes), so overlap buys no wall-clock time.
+        self._tts_sem = asyncio.Semaphore(1)
+        self._stt_sem = asyncio.Semaphore(1)
+
+        # Same prefix every call, so build it once (also keeps Groq's prompt cache warm)
+        self._system_msg = SystemMessage(content=self.get_system_prompt())
+
+        # Conversation memory (the only record of the chat; fallback replies don't use it)
+        self.memory = None
+        if self.ai_client:
+            self.memory = ConversationSummaryBufferMemory(
+                llm=self.ai_client,
+                max_token_limit=SUMMARY_TOKEN_LIMIT,
+                return_messages=True,
+            )
 
         # Calibrate mic
-        self._calibrate_microphone()
+        self._calibrate_microphone(recalibrate)
 
     # ---------- Personality ----------
     def get_system_prompt(self) -> str:
@@ -97,132 +255,410 @@ class MayaAI:
         )
 
     # ---------- Audio ----------
-    def _calibrate_microphone(self):
-        """Calibrate microphone for background noise"""
+    def _calibrate_microphone(self, recalibrate: bool = False):
+        """Calibrate microphone for background noise, reusing a recent calibration"""
+        self.recognizer.dynamic_energy_threshold = True  # tracks drift after startup
+        if not recalibrate:
+            try:
+                with open(CALIBRATION_FILE) as f:
+                    calib = json.load(f)
+                if time.time() - calib["calibrated_at"] < CALIBRATION_MAX_AGE:
+                    self.recognizer.energy_threshold = max(calib["energy_threshold"],
+                                                           MIN_ENERGY_THRESHOLD)
+                    print("Microphone ready!")
+                    return
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
         try:
             with self.microphone as source:
                 print("Calibrating microphone... Please wait.")
                 self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            self.recognizer.energy_threshold = max(self.recognizer.energy_threshold,
+                                                   MIN_ENERGY_THRESHOLD)
             print("Microphone ready!")
         except Exception as e:
             logger.error(f"Microphone setup failed: {e}")
+            return
 
-    def listen_for_speech(self) -> str:
+        try:
+            os.makedirs(os.path.dirname(CALIBRATION_FILE), exist_ok=True)
+            with open(CALIBRATION_FILE, "w") as f:
+                json.dump({"energy_threshold": self.recognizer.energy_threshold,
+                           "calibrated_at": time.time()}, f)
+        except OSError as e:
+            logger.warning(f"Could not save mic calibration: {e}")
+
+    async def listen_for_speech(self) -> str:
         """Listen to user voice"""
         try:
-            with self.microphone as source:
-                print("\n🎤 Listening... Speak now!")
-                audio = self.recognizer.listen(source, timeout=15, phrase_time_limit=10)
+            self._listening.set()
+            try:
+                audio = await asyncio.to_thread(self._capture_speech)
+            finally:
+                self._listening.clear()
             print("Processing speech...")
-            text = self.recognizer.recognize_google(audio)
-            return text.strip()
+            async with self._stt_sem:
+                text = await asyncio.to_thread(self._transcribe, audio)
+            if not text:
+                print("Sorry, I couldn't understand that.")
+            return text
         except sr.WaitTimeoutError:
             return ""
-        except sr.UnknownValueError:
-            print("Sorry, I couldn't understand that.")
-            return ""
-        except sr.RequestError as e:
+        except Exception as e:
             logger.error(f"Speech recognition error: {e}")
             return ""
 
+    def _capture_speech(self) -> sr.AudioData:
+        """Record one phrase from the mic (blocking, run off the event loop).
+        Waits for speech in 1 s slices so a closed window doesn't leave it hanging."""
+        with self.microphone as source:
+            print("\n🎤 Listening... Speak now!")
+            deadline = time.time() + 15
+            while not self._stop_listening.is_set():
+                try:
+                    return self.recognizer.listen(source, timeout=1, phrase_time_limit=10)
+                except sr.WaitTimeoutError:
+                    if time.time() >= deadline:
+                        raise
+            raise sr.WaitTimeoutError("Window closed while listening")
+
+    def _transcribe(self, audio: sr.AudioData) -> str:
+        """Transcribe one phrase with local Whisper, or Google if it failed to load
+        (blocking, run off the event loop)"""
+        if not self.stt_model:
+            try:
+                return self.recognizer.recognize_google(audio).strip()
+            except sr.UnknownValueError:
+                return ""
+        raw = audio.get_raw_data(convert_rate=WHISPER_SAMPLE_RATE, convert_width=2)
+        pcm = np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+        segments, _ = self.stt_model.transcribe(
+            pcm, language="en", beam_size=1, vad_filter=True
+        )
+        # segments is lazy; decoding happens while it is consumed here
+        return " ".join(segment.text.strip() for segment in segments).strip()
+
     async def speak(self, text: str):
         """Convert AI response to speech + animate avatar"""
         if not text.strip():
             return
+        chunks = asyncio.Queue()
+        await self._say(text, chunks, asyncio.create_task(self._stream_tts(text, chunks)))
+
+    async def speak_stream(self, sentences):
+        """Speak sentences as they arrive, synthesizing the next one while the current one plays"""
+        pending = asyncio.Queue()
+
+        async def synthesize():
+            try:
+                async for sentence in sentences:
+                    if not sentence.strip():
+                        continue
+                    chunks = asyncio.Queue()
+                    producer = asyncio.create_task(self._stream_tts(sentence, chunks))
+                    await pending.put((sentence, chunks, producer))
+            finally:
+                await pending.put(None)
+
+        synthesizer = asyncio.create_task(synthesize())
+        while (item := await pending.get()) is not None:
+            await self._say(*item)
+        await synthesizer
+
+    async def _say(self, text: str, chunks: asyncio.Queue, producer: asyncio.Task):
+        """Play one utterance whose audio is being streamed into `chunks`"""
         print(f"Maya: {text}")
         try:
-            communicate = edge_tts.Communicate(text, voice=TTS_VOICE)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp_file:
-                audio_path = tmp_file.name
-                await communicate.save(audio_path)
-
-            # Play sound in a thread
-            import threading
-            threading.Thread(target=playsound, args=(audio_path,), daemon=True).start()
-
-            # Animate mouth while sound plays
-            start_time = time.time()
-            duration = len(text) * 0.07  # rough speech length estimate
-
-            while time.time() - start_time < duration:
-                self.current_face = random.choice(
-                    [self.mouth_closed, self.mouth_half, self.mouth_open]
-                )
-                self.update_screen()
-                self.clock.tick(5)  # ~200ms per frame
+            levels = asyncio.Queue()
+            player = asyncio.create_task(self._play_stream(chunks, levels))
+
+            # Move the mouth with the loudness of the audio actually playing
+            while (rms := await levels.get()) is not None:
+                if rms >= MOUTH_OPEN_RMS:
+                    self.current_face = self.mouth_open
+                elif rms >= MOUTH_HALF_RMS:
+                    self.current_face = self.mouth_half
+                else:
+                    self.current_face = self.mouth_closed
 
             # Reset to closed mouth
             self.current_face = self.mouth_closed
-            self.update_screen()
 
-            os.unlink(audio_path)
+            await asyncio.gather(producer, player)
 
         except Exception as e:
             logger.error(f"TTS error: {e}")
 
+    async def _stream_tts(self, text: str, chunks: asyncio.Queue):
+        """Push MP3 chunks from edge-tts onto the queue as they arrive, serving repeats from cache"""
+        key = self._tts_key(text)
+        try:
+            cached = self._tts_cache.get(key)
+            if cached is not None:
+                self._tts_cache.move_to_end(key)
+                await chunks.put(cached)
+                return
+
+            audio = io.BytesIO()
+            async with self._tts_sem:
+                # A fresh Communicate per utterance is deliberate: edge-tts opens one
+                # WebSocket per stream() inside its own ClientSession (which closes any
+                # connector handed to it), so there is no connection to keep alive.
+                # The handshake is hidden instead by synthesizing the next sentence
+                # while the current one plays (speak_stream).
+                communicate = edge_tts.Communicate(text, voice=TTS_VOICE)
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        audio.write(chunk["data"])
+                        await chunks.put(chunk["data"])
+
+            self._tts_cache[key] = audio.getvalue()
+            if len(self._tts_cache) > TTS_CACHE_SIZE:
+                self._tts_cache.popitem(last=False)
+        finally:
+            await chunks.put(None)
+
+    @staticmethod
+    def _tts_key(text: str) -> str:
+        return hashlib.md5(f"{text}|{TTS_VOICE}".encode()).hexdigest()
+
+    async def _prewarm_tts_cache(self):
+        """Synthesize the fixed and fallback lines in the background so they are cached
+        before use. Only runs while the user is speaking, so live replies go first."""
+        fallbacks = [line for lines in self.FALLBACK_RESPONSES.values() for line in lines]
+        fixed = [self.GOODBYE, self.SEE_YOU_LATER, self.SESSION_OVER, self.INACTIVE, self.ERROR]
+        # Without an AI client the fallbacks are every reply, so warm them first
+        for text in (fallbacks + fixed if not self.ai_client else fixed + fallbacks):
+            if self._tts_key(text) in self._tts_cache:
+                continue
+            await self._listening.wait()
+            try:
+                await self._stream_tts(text, asyncio.Queue())
+            except Exception as e:
+                logger.warning(f"TTS prewarm failed: {e}")
+
+    async def _play_stream(self, chunks: asyncio.Queue, levels: asyncio.Queue):
+        """Feed streamed MP3 to the speaker, starting once a small prebuffer is in;
+        reports the loudness of each ~33 ms of audio to `levels` as it is heard, then None"""
+        loop = asyncio.get_running_loop()
+        source = _ChunkSource()
+        done = loop.create_future()
+        starting = None
+        buffered = 0
+        try:
+            while (data := await chunks.get()) is not None:
+                source.feed(data)
+                buffered += len(data)
+                if starting is None and buffered >= TTS_PREBUFFER_BYTES:
+                    starting = asyncio.create_task(self._start_playback(source, done, levels))
+            source.finish()
+            if starting is None and buffered:
+                starting = asyncio.create_task(self._start_playback(source, done, levels))
+            if starting is None:
+                return
+
+            device, decoding = await starting
+            try:
+                end = await done
+                await asyncio.sleep(max(0.0, end - loop.time()))  # until the last block is heard
+            finally:
+                device.close()
+            await decoding
+        finally:
+            source.finish()
+            levels.put_nowait(None)
+
+    async def _start_playback(self, source: _ChunkSource, done: asyncio.Future,
+                              levels: asyncio.Queue):
+        """Start decoding on a worker thread and the device on the decoded PCM"""
+        decoded = queue.Queue()
+        pcm_stream = await asyncio.to_thread(self._open_decoder, source, decoded)
+        decoding = asyncio.create_task(asyncio.to_thread(self._decode, pcm_stream, decoded))
+
+        loop = asyncio.get_running_loop()
+        frames = self._playback_frames(
+            decoded,
+            clock=loop.time,
+            on_levels=lambda timed: loop.call_soon_threadsafe(self._schedule_levels, levels, timed),
+            on_done=lambda end: loop.call_soon_threadsafe(done.set_result, end),
+        )
+        next(frames)
+        device = miniaudio.PlaybackDevice(
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=1,
+            sample_rate=TTS_SAMPLE_RATE,
+            buffersize_msec=PLAYBACK_BUFFER_MS,
+        )
+        device.start(frames)
+        return device, decoding
+
+    @staticmethod
+    def _schedule_levels(levels: asyncio.Queue, timed: list):
+        """Release each (play time, RMS) pair to the animation when that audio is heard"""
+        loop = asyncio.get_running_loop()
+        for play_at, rms in timed:
+            loop.call_at(play_at, levels.put_nowait, rms)
+
+    @staticmethod
+    def _open_decoder(source: _ChunkSource, decoded: queue.Queue):
+        """Open the MP3 decoder and pre-decode the device's first two periods, so
+        playback doesn't start with an underrun (blocking, run off the event loop)"""
+        pcm_stream = miniaudio.stream_any(
+            source,
+            source_format=miniaudio.FileFormat.MP3,
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=1,
+            sample_rate=TTS_SAMPLE_RATE,
+        )
+        ready = 0
+        for samples in pcm_stream:
+            decoded.put(samples.tobytes())
+            ready += len(samples)
+            if ready >= 2 * TTS_SAMPLE_RATE * PLAYBACK_BUFFER_MS // 1000:
+                break
+        return pcm_stream
+
+    @staticmethod
+    def _decode(pcm_stream, decoded: queue.Queue):
+        """Decode the MP3 stream as it arrives (blocking on the network is fine here)"""
+        try:
+            for samples in pcm_stream:
+                decoded.put(samples.tobytes())
+        except Exception as e:
+            logger.error(f"Audio decode error: {e}")
+        finally:
+            decoded.put(None)
+
+    @staticmethod
+    def _playback_frames(decoded: queue.Queue, clock, on_levels, on_done):
+        """Hand decoded PCM to the device and flag the time playback ends when it runs dry.
+        Reports the RMS of every ~33 ms window with the clock time it will be heard, since
+        each block plays only after those already queued in the device.
+        Runs on miniaudio's audio thread, so it never blocks: if the network falls
+        behind the device plays silence until more audio is decoded."""
+        pending = bytearray()
+        finished = False
+        play_at = 0.0  # clock time at which the next frame handed over is heard
+        frame_count = yield b""
+        try:
+            while True:
+                wanted = frame_count * 2  # int16 mono
+                while len(pending) < wanted and not finished:
+                    try:
+                        samples = decoded.get_nowait()
+                    except queue.Empty:
+                        break
+                    if samples is None:
+                        finished = True
+                    else:
+                        pending += samples
+                if finished and not pending:
+                    break
+
+                block = bytes(pending[:wanted]).ljust(wanted, b"\0")
+                del pending[:wanted]
+                pcm = np.frombuffer(block, dtype=np.int16).astype(np.float32)
+                play_at = max(play_at, clock())
+                on_levels([
+                    (play_at + start / TTS_SAMPLE_RATE,
+                     float(np.sqrt((pcm[start:start + LEVEL_WINDOW_FRAMES] ** 2).mean())))
+                    for start in range(0, len(pcm), LEVEL_WINDOW_FRAMES)
+                ])
+                play_at += len(pcm) / TTS_SAMPLE_RATE
+                frame_count = yield block
+            on_done(play_at)
+        except Exception:
+            on_done(max(play_at, clock()))
+            raise
+
     # ---------- Screen ----------
+    def _load_face(self, path: str) -> pygame.Surface:
+        # The faces are opaque and cover the whole window, so no alpha and no background fill
+        face = pygame.image.load(path)
+        return pygame.transform.smoothscale(face, self.screen.get_size()).convert()
+
+    async def _ui_loop(self):
+        """Pump pygame events and redraw at a fixed rate, whatever the conversation is doing"""
+        while not self._shutdown.is_set():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self._quit.set()
+                    self._stop_listening.set()
+            self.update_screen()
+            await asyncio.sleep(1 / UI_FPS)
+
     def update_screen(self):
-        self.screen.fill((255, 255, 255))  # white background
         self.screen.blit(self.current_face, (0, 0))
         pygame.display.flip()
 
     # ---------- AI ----------
-    async def get_ai_response(self, user_input: str) -> str:
-        """Get AI response with memory"""
+    async def stream_ai_response(self, user_input: str):
+        """Stream the AI response with memory, one speakable sentence at a time"""
         if not self.ai_client:
-            return self._get_fallback_response(user_input)
+            yield self._get_fallback_response(user_input)
+            return
 
+        spoken = []
         try:
-            messages = [SystemMessage(content=self.get_system_prompt())]
-            history = self.memory.chat_memory.messages[:]  # context
-            messages.extend(history)
+            messages = [self._system_msg]
+            if self.memory.moving_summary_buffer:
+                messages.append(SystemMessage(
+                    content=f"Summary of the conversation so far: {self.memory.moving_summary_buffer}"
+                ))
+            messages.extend(_trim_history(self.memory.chat_memory.messages))  # context
             messages.append(HumanMessage(content=user_input))
 
-            response = await self.ai_client.ainvoke(messages)
-            ai_response = response.content.strip()
-
-            # Update memory
-            self.memory.chat_memory.add_user_message(user_input)
-            self.memory.chat_memory.add_ai_message(ai_response)
-
-            return ai_response
+            buffer = ""
+            token_count = 0
+            async for chunk in self.ai_client.astream(messages):
+                # The boundary check needs the next token, so flush before appending it
+                if buffer and _is_sentence_boundary(buffer, chunk.content, token_count):
+                    sentence = buffer.strip()
+                    buffer, token_count = "", 0
+                    if sentence:
+                        spoken.append(sentence)
+                        yield sentence
+                buffer += chunk.content
+                token_count += 1
+            if buffer.strip():
+                spoken.append(buffer.strip())
+                yield buffer.strip()
+
+            # Update memory; only summarizes (a blocking LLM call) once something is pruned
+            await asyncio.to_thread(self._remember, user_input, " ".join(spoken))
         except Exception as e:
             logger.error(f"AI response error: {e}")
-            return self._get_fallback_response(user_input)
+            if not spoken:
+                yield self._get_fallback_response(user_input)
+
+    def _remember(self, user_input: str, reply: str):
+        """Store a turn and fold whatever leaves the prompt window into the summary"""
+        self.memory.save_context({"input": user_input}, {"output": reply})
+        buffer = self.memory.chat_memory.messages
+        overflow = len(buffer) - 2 * RECENT_TURNS
+        if overflow > 0:
+            pruned = buffer[:overflow]
+            del buffer[:overflow]
+            self.memory.moving_summary_buffer = self.memory.predict_new_summary(
+                pruned, self.memory.moving_summary_buffer
+            )
 
     def _get_fallback_response(self, user_input: str) -> str:
         """Fallback responses when AI unavailable"""
-        user_lower = user_input.lower()
-        if any(word in user_lower for word in ['sad', 'upset', 'bad', 'terrible']):
-            responses = [
-                "I'm sorry you're feeling that way. I'm here to listen.",
-                "That sounds rough. Do you want to talk about it?",
-                "I hear you. You’re not alone in this."
-            ]
-        elif any(word in user_lower for word in ['happy', 'good', 'great', 'excited']):
-            responses = [
-                "That's wonderful! Tell me more!",
-                "I’m so glad to hear that. What made you feel this way?",
-                "Your happiness makes me happy too!"
-            ]
-        elif any(word in user_lower for word in ['tired', 'exhausted', 'sleepy']):
-            responses = [
-                "You sound tired. Make sure you rest well.",
-                "Sleep is important. Have you been overworking?",
-                "Take care of yourself, okay?"
-            ]
+        if _SAD_RE.search(user_input):
+            mood = "sad"
+        elif _HAPPY_RE.search(user_input):
+            mood = "happy"
+        elif _TIRED_RE.search(user_input):
+            mood = "tired"
         else:
-            responses = [
-                "That's interesting. Tell me more!",
-                "I'm listening closely. What else is on your mind?",
-                "Thanks for sharing. How does that make you feel?"
-            ]
-        return random.choice(responses)
+            mood = "neutral"
+        return random.choice(self.FALLBACK_RESPONSES[mood])
 
     def is_goodbye(self, text: str) -> bool:
         """Detect if user wants to end chat"""
-        goodbye_words = ['bye', 'goodbye', 'quit', 'exit', 'stop', 'end']
-        return any(word in text.lower() for word in goodbye_words)
+        return bool(_GOODBYE_RE.search(text))
 
     # ---------- Conversation Loop ----------
     async def run_conversation(self):
@@ -232,65 +668,83 @@ class MayaAI:
         print("Say 'bye' or 'goodbye' anytime to exit.")
         print("=" * 50)
 
-        # Greeting
-        await self.speak("Hey! I'm Maya. How are you feeling today?")
+        self._ui_task = asyncio.create_task(self._ui_loop())
+        listening = None
 
-        session_start = time.time()
-        last_activity = time.time()
-        SESSION_LIMIT = 5 * 60        # 5 minutes
-        INACTIVITY_LIMIT = 2 * 60     # 2 minutes
-
-        running = True
-        while running:
-            # Handle Pygame events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    await self.speak("Alright, I'll see you later!")
-                    running = False
-
-            try:
-                # Timeouts
-                if time.time() - session_start > SESSION_LIMIT:
-                    await self.speak("Our session is ending now. See you next time!")
-                    break
-                if time.time() - last_activity > INACTIVITY_LIMIT:
-                    await self.speak("I didn’t hear you for a while, so I’ll end our chat. Bye!")
-                    break
-
-                user_input = self.listen_for_speech()
-                if not user_input:
-                    continue
-
-                last_activity = time.time()
-                print(f"You: {user_input}")
-
-                if self.is_goodbye(user_input):
-                    await self.speak("It was lovely chatting with you. "
-                                     "I won’t remember this next time, "
-                                     "but I enjoyed talking to you now.")
+        try:
+            # Greeting
+            await self.speak(self.GREETING)
+            self._prewarm_task = asyncio.create_task(self._prewarm_tts_cache())
+
+            session_start = time.time()
+            last_activity = time.time()
+            SESSION_LIMIT = 5 * 60        # 5 minutes
+            INACTIVITY_LIMIT = 2 * 60     # 2 minutes
+
+            while True:
+                try:
+                    # Timeouts
+                    if time.time() - session_start > SESSION_LIMIT:
+                        await self.speak(self.SESSION_OVER)
+                        break
+                    if time.time() - last_activity > INACTIVITY_LIMIT:
+                        await self.speak(self.INACTIVE)
+                        break
+
+                    # Closing the window ends the chat without waiting for the mic to time out
+                    listening = asyncio.create_task(self.listen_for_speech())
+                    closing = asyncio.create_task(self._quit.wait())
+                    await asyncio.wait({listening, closing}, return_when=asyncio.FIRST_COMPLETED)
+                    closing.cancel()
+                    if self._quit.is_set():
+                        # The mic thread sees _stop_listening within a second and exits
+                        listening.cancel()
+                        await asyncio.gather(listening, return_exceptions=True)
+                        await self.speak(self.SEE_YOU_LATER)
+                        break
+
+                    user_input = listening.result()
+                    if not user_input:
+                        continue
+
+                    last_activity = time.time()
+                    print(f"You: {user_input}")
+
+                    if self.is_goodbye(user_input):
+                        await self.speak(self.GOODBYE)
+                        break
+
+                    await self.speak_stream(self.stream_ai_response(user_input))
+
+                except asyncio.CancelledError:
+                    # Ctrl+C: asyncio.run() cancels this task rather than raising KeyboardInterrupt
+                    self._stop_listening.set()
+                    await self.speak(self.SEE_YOU_LATER)
                     break
-
-                ai_response = await self.get_ai_response(user_input)
-                await self.speak(ai_response)
-
-            except KeyboardInterrupt:
-                await self.speak("Alright, I'll see you later!")
-                break
-            except Exception as e:
-                logger.error(f"Conversation error: {e}")
-                await self.speak("Oops, something went wrong. Let's try again.")
-
-        # Cleanup
-        self.memory.clear()
-        pygame.quit()
-        print("\n" + "=" * 50)
-        print("Conversation ended. Session memory cleared.")
-        print("=" * 50)
+                except Exception as e:
+                    logger.error(f"Conversation error: {e}")
+                    await self.speak(self.ERROR)
+
+        finally:
+            # Cleanup; the mic thread must stop or interpreter shutdown waits on it
+            self._stop_listening.set()
+            if listening:
+                listening.cancel()
+            if self._prewarm_task:
+                self._prewarm_task.cancel()
+            self._shutdown.set()
+            await self._ui_task
+            if self.memory:
+                self.memory.clear()
+            pygame.quit()
+            print("\n" + "=" * 50)
+            print("Conversation ended. Session memory cleared.")
+            print("=" * 50)
 
 
 # ============ MAIN ============
 async def main():
-    maya = MayaAI()
+    maya = MayaAI(recalibrate="--recalibrate" in sys.argv)
     await maya.run_conversation()
 
 